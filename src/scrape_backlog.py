@@ -2,22 +2,28 @@
 
 from __future__ import annotations
 
+import argparse
+import asyncio
 import csv
+import functools
+import hashlib
+import io
 import logging
 import math
+import os
 import re
-from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
-from dataclasses import dataclass
-from datetime import datetime
+import socket
+import tempfile
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from html import unescape
 from pathlib import Path
 from typing import Optional
 
-import matplotlib.dates as mdates
-import matplotlib.pyplot as plt
-import requests
-from bs4 import BeautifulSoup, Tag
-from dateutil import parser as date_parser
-from dateutil.relativedelta import relativedelta
+import httpx
+from lxml import etree
+from lxml import html as lxml_html
 
 LOGGER = logging.getLogger(__name__)
 BASE_URL = (
@@ -43,24 +49,81 @@ INDEX_URLS = [
 DEFAULT_START_PAGE_ID = 116
 MAX_PAGES_TO_CHECK = 400  # safeguard so we don't loop forever if structure changes
 REQUEST_TIMEOUT = 30
-MAX_WORKERS = 6
+MAX_CONCURRENT_REQUESTS = 20
+MAX_RETRIES = 3
+RETRY_BACKOFF_SECONDS = 0.5
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
 CONSECUTIVE_NOT_FOUND_LIMIT = 5
+HTTP_CACHE_DIR = Path(".cache") / "http"
+HTTP_CACHE_TTL = timedelta(days=7)
 TARGET_CAPTION = (
     "Final Action Dates for Employment-Based Adjustment of Status Applications"
 )
 TARGET_ROW_LABEL = "3rd"
+TARGET_ROW_PREFIXES = (TARGET_ROW_LABEL, "third")
+PLOT_TITLE = "EB-3 All Chargeability Backlog (Final Action Dates)"
+PLOT_X_LABEL = "Visa Bulletin Month"
+PLOT_Y_LABEL = "Backlog (months)"
+PLOT_COLOR = "#2a6f97"
 USER_AGENT = (
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 14_0) "
     "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/127.0.0.0 Safari/537.36"
 )
 
-MONTH_REGEX = re.compile(
-    r"(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4}",
+MONTH_NAMES = (
+    "January",
+    "February",
+    "March",
+    "April",
+    "May",
+    "June",
+    "July",
+    "August",
+    "September",
+    "October",
+    "November",
+    "December",
+)
+MONTH_REGEX = re.compile(rf"({'|'.join(MONTH_NAMES)})\s+\d{{4}}", re.IGNORECASE)
+# Same match against undecoded page bytes, where the gap may still be an entity.
+MONTH_REGEX_BYTES = re.compile(
+    rf"({'|'.join(MONTH_NAMES)})(?:\s|&nbsp;|&#160;|\xc2\xa0)+(\d{{4}})".encode(),
+    re.IGNORECASE,
+)
+MONTH_ABBREVIATIONS = {
+    name[:3].upper(): number for number, name in enumerate(MONTH_NAMES, start=1)
+}
+FINAL_ACTION_DATE_RE = re.compile(r"(\d{1,2})([A-Z]{3})(\d{2})")
+NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+EMP_LINK_RE = re.compile(r"employment-based-(\d+)", re.IGNORECASE)
+# Raw-bytes patterns used to triage a page before paying for a full parse.
+# Words may be split by whitespace, non-breaking spaces (raw or as entities)
+# or inline tags; scan_uscis_page makes the exact match on parsed text.
+TARGET_CAPTION_GAP = rb"(?:\s|&nbsp;|&#160;|\xc2\xa0|<[^>]*>)+"
+TARGET_CAPTION_RE = re.compile(
+    TARGET_CAPTION_GAP.join(
+        re.escape(word.encode()) for word in TARGET_CAPTION.split()
+    ),
     re.IGNORECASE,
 )
+H1_RE = re.compile(rb"<h1\b([^>]*)>(.*?)</h1\s*>", re.IGNORECASE | re.DOTALL)
+TAG_RE = re.compile(r"<[^>]+>")
+
+# XPath 1.0 has no lower-case(); translate() with these does the case folding.
+_UPPER = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_LOWER = "abcdefghijklmnopqrstuvwxyz"
+DOS_EMPLOYMENT_TABLE_XPATH = etree.XPath(
+    f"//table[(.//tr)[1][contains(translate(., '{_UPPER}', '{_LOWER}'), 'employment')"
+    f" and contains(translate(., '{_UPPER}', '{_LOWER}'), 'chargeability')]]"
+)
+ROWS_XPATH = etree.XPath(".//tr")
+CELLS_XPATH = etree.XPath(".//th | .//td")
+ROW_LABEL_XPATH = etree.XPath("string(((.//th)[1] | (.//td)[1])[1])")
+THEAD_ROW_XPATH = etree.XPath("(.//thead//tr)[1]")
+FIRST_ROW_XPATH = etree.XPath("(.//tr)[1]")
 
 
-@dataclass
+@dataclass(slots=True)
 class BulletinRecord:
     """Represents data extracted for a single visa bulletin month."""
 
@@ -68,33 +131,124 @@ class BulletinRecord:
     raw_date: str
     backlog_months: Optional[float]
     source_url: str
+    # Formatted once here instead of on every logging / CSV access.
+    month_label: str = field(init=False, repr=False, compare=False)
+    backlog_label: str = field(init=False, repr=False, compare=False)
 
-    @property
-    def month_label(self) -> str:
-        return self.bulletin_month.strftime("%b %Y")
-
-    @property
-    def backlog_label(self) -> str:
+    def __post_init__(self) -> None:
+        self.month_label = self.bulletin_month.strftime("%b %Y")
         if self.backlog_months is None or math.isnan(self.backlog_months):
-            return "N/A"
-        return f"{self.backlog_months:.2f}"
+            self.backlog_label = "N/A"
+        else:
+            self.backlog_label = f"{self.backlog_months:.2f}"
 
 
-def fetch_page_html(page_id: int) -> tuple[str, str]:
-    url = BASE_URL.format(page_id)
-    LOGGER.info("Fetching %s", url)
-    response = requests.get(
-        url, timeout=REQUEST_TIMEOUT, headers={"User-Agent": USER_AGENT}
+def is_cache_fresh(path: Path) -> bool:
+    try:
+        age = time.time() - path.stat().st_mtime
+    except FileNotFoundError:
+        return False
+    return age < HTTP_CACHE_TTL.total_seconds()
+
+
+def make_client() -> httpx.AsyncClient:
+    """Build the pooled HTTP/2 client shared by every request of a crawl.
+
+    In-flight requests to uscis.gov / travel.state.gov multiplex over shared
+    keep-alive connections and wait for a pooled connection rather than open
+    throwaway ones. httpcore already sets TCP_NODELAY; SO_KEEPALIVE keeps
+    idle sockets alive.
+    """
+    return httpx.AsyncClient(
+        headers={"User-Agent": USER_AGENT},
+        timeout=REQUEST_TIMEOUT,
+        follow_redirects=True,
+        transport=httpx.AsyncHTTPTransport(
+            http2=True,
+            limits=httpx.Limits(
+                max_keepalive_connections=MAX_CONCURRENT_REQUESTS,
+                max_connections=MAX_CONCURRENT_REQUESTS,
+            ),
+            retries=MAX_RETRIES,
+            socket_options=[(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)],
+        ),
     )
+
+
+async def http_get(client: httpx.AsyncClient, url: str) -> httpx.Response:
+    """GET ``url``, backing off and retrying throttled or failed responses.
+
+    The transport already retries failed connects; this covers HTTP-level
+    failures such as 429 and 503.
+    """
+    for attempt in range(MAX_RETRIES):
+        response = await client.get(url)
+        if response.status_code not in RETRY_STATUS_CODES:
+            return response
+        delay = RETRY_BACKOFF_SECONDS * 2**attempt
+        LOGGER.debug(
+            "%s returned %s; retrying in %.1fs", url, response.status_code, delay
+        )
+        await asyncio.sleep(delay)
+    return await client.get(url)
+
+
+def cache_path_for(url: str) -> Path:
+    return HTTP_CACHE_DIR / hashlib.sha1(url.encode("utf-8")).hexdigest()
+
+
+def remember_missing(url: str) -> None:
+    """Negative-cache a 404 so re-runs don't probe that URL again.
+
+    A still-fresh marker means the miss was served from the cache; leave its
+    mtime alone so the TTL runs out and the URL is re-checked.
+    """
+    missing_path = cache_path_for(url).with_suffix(".404")
+    if is_cache_fresh(missing_path):
+        return
+    HTTP_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    missing_path.touch()
+
+
+async def fetch_cached(client: httpx.AsyncClient, url: str) -> bytes:
+    """Fetch ``url``, serving repeat requests from the on-disk HTTP cache.
+
+    A 404 raises ``FileNotFoundError`` but is not cached here: only callers
+    that know the miss is real (not a speculative probe) call
+    ``remember_missing``.
+    """
+    cache_path = cache_path_for(url)
+    missing_path = cache_path.with_suffix(".404")
+    if is_cache_fresh(missing_path):
+        raise FileNotFoundError(f"{url} returned 404 (cached).")
+    if is_cache_fresh(cache_path):
+        LOGGER.debug("Using cached copy of %s", url)
+        return cache_path.read_bytes()
+
+    response = await http_get(client, url)
     if response.status_code == 404:
-        raise FileNotFoundError(f"USCIS page {url} returned 404.")
+        raise FileNotFoundError(f"{url} returned 404.")
     response.raise_for_status()
-    return response.text, url
+    HTTP_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+
+    # Write to a temp file first so a concurrent run never reads a partial body.
+    fd, tmp_name = tempfile.mkstemp(dir=HTTP_CACHE_DIR, suffix=".tmp")
+    with os.fdopen(fd, "wb") as handle:
+        handle.write(response.content)
+    os.replace(tmp_name, cache_path)
+    return response.content
+
+
+async def fetch_page_html(client: httpx.AsyncClient, page_id: int) -> tuple[bytes, str]:
+    url = BASE_URL.format(page_id)
+    LOGGER.info("Fetching %s", url)
+    return await fetch_cached(client, url), url
 
 
+@functools.lru_cache(maxsize=512)
 def build_dos_url(bulletin_month: datetime) -> str:
-    month_slug = bulletin_month.strftime("%B").lower()
-    slug_year = bulletin_month.strftime("%Y")
+    month_slug = MONTH_NAMES[bulletin_month.month - 1].lower()
+    slug_year = str(bulletin_month.year)
     folder_year = bulletin_month.year
     if bulletin_month.month >= 10:
         folder_year += 1
@@ -103,25 +257,24 @@ def build_dos_url(bulletin_month: datetime) -> str:
     )
 
 
-def discover_latest_start_page_id() -> int:
+async def discover_latest_start_page_id(client: httpx.AsyncClient) -> int:
     LOGGER.info("Discovering latest USCIS employment-based bulletin page ID")
 
-    for index_url in INDEX_URLS:
+    # Request every index page at once but still prefer them in listed order.
+    responses = await asyncio.gather(
+        *(http_get(client, index_url) for index_url in INDEX_URLS),
+        return_exceptions=True,
+    )
+    for index_url, response in zip(INDEX_URLS, responses):
         try:
-            response = requests.get(
-                index_url, timeout=REQUEST_TIMEOUT, headers={"User-Agent": USER_AGENT}
-            )
+            if isinstance(response, BaseException):
+                raise response
             response.raise_for_status()
         except Exception as exc:  # pragma: no cover - network resilience
             LOGGER.debug("Failed to fetch %s: %s", index_url, exc)
             continue
 
-        matches = {
-            int(match)
-            for match in re.findall(
-                r"employment-based-(\d+)", response.text, re.IGNORECASE
-            )
-        }
+        matches = {int(match) for match in EMP_LINK_RE.findall(response.text)}
         if matches:
             latest_id = max(matches)
             LOGGER.info("Discovered latest page id %s from %s", latest_id, index_url)
@@ -133,7 +286,9 @@ def discover_latest_start_page_id() -> int:
     )
 
 
-def fetch_dos_final_action(bulletin_month: datetime) -> tuple[str, str]:
+async def fetch_dos_final_action(
+    client: httpx.AsyncClient, bulletin_month: datetime
+) -> tuple[str, str]:
     url = build_dos_url(bulletin_month)
     LOGGER.info(
         "Falling back to Department of State bulletin %s for %s",
@@ -141,13 +296,15 @@ def fetch_dos_final_action(bulletin_month: datetime) -> tuple[str, str]:
         bulletin_month.strftime("%b %Y"),
     )
 
-    response = requests.get(
-        url, timeout=REQUEST_TIMEOUT, headers={"User-Agent": USER_AGENT}
-    )
-    response.raise_for_status()
-    soup = BeautifulSoup(response.text, "html.parser")
+    try:
+        html = await fetch_cached(client, url)
+    except FileNotFoundError as exc:
+        remember_missing(url)
+        # Only USCIS 404s mean "end of archive"; a missing DOS page is a skip.
+        raise ValueError(f"DOS bulletin {url} returned 404.") from exc
+    tree = lxml_html.fromstring(html)
 
-    table = find_dos_employment_table(soup)
+    table = find_dos_employment_table(tree)
 
     column_index = get_chargeability_column_index(table)
     target_row = find_target_row(table)
@@ -156,75 +313,114 @@ def fetch_dos_final_action(bulletin_month: datetime) -> tuple[str, str]:
     return raw_value, url
 
 
-def parse_bulletin_month(soup: BeautifulSoup) -> datetime:
-    header = soup.find("h1", class_=re.compile("page-title")) or soup.find("h1")
-    if header:
-        match = MONTH_REGEX.search(header.get_text(" ", strip=True))
-        if match:
-            month_text = match.group(0).replace("\xa0", " ")
-            return date_parser.parse(month_text, fuzzy=True)
+def element_text(element: etree._Element) -> str:
+    """Join an element's stripped text pieces with spaces, skipping comments."""
+    return " ".join(piece.strip() for piece in element.itertext() if piece.strip())
+
+
+def month_from_match(match: re.Match[str]) -> datetime:
+    # MONTH_REGEX already guarantees "<Month> <Year>", so skip fuzzy parsing.
+    return datetime.strptime(" ".join(match.group(0).split()), "%B %Y")
+
+
+def header_text_from_html(html: bytes) -> str:
+    """Return the page-title ``<h1>`` text (or the first ``<h1>``) via regex."""
+    headers = H1_RE.findall(html)
+    titled = [body for attrs, body in headers if b"page-title" in attrs]
+    bodies = titled or [body for _, body in headers]
+    if not bodies:
+        return ""
+    return unescape(TAG_RE.sub(" ", bodies[0].decode("utf-8", "replace")))
 
-    month_heading = soup.find(string=MONTH_REGEX)
-    if month_heading:
-        match = MONTH_REGEX.search(month_heading)
-        if match:
-            month_text = match.group(0).replace("\xa0", " ")
-            return date_parser.parse(month_text, fuzzy=True)
+
+def parse_bulletin_month(html: bytes, header_text: Optional[str] = None) -> datetime:
+    """Read the month from the page header, else the first month in the page.
+
+    Without ``header_text`` the header is located with a regex, so pages that
+    skip the parse can still be dated.
+    """
+    if header_text is None:
+        header_text = header_text_from_html(html)
+    match = MONTH_REGEX.search(header_text)
+    if match:
+        return month_from_match(match)
+
+    raw_match = MONTH_REGEX_BYTES.search(html)
+    if raw_match:
+        month_name, year = (group.decode("ascii") for group in raw_match.groups())
+        return datetime.strptime(f"{month_name} {year}", "%B %Y")
 
     raise ValueError("Unable to determine bulletin month from page content.")
 
 
-def find_dos_employment_table(soup: BeautifulSoup) -> Tag:
-    for table in soup.find_all("table"):
-        header_row = table.find("tr")
-        if header_row is None:
+def scan_uscis_page(html: bytes) -> tuple[Optional[str], Optional[etree._Element]]:
+    """Stream a USCIS page up to the target table.
+
+    Returns the page-title ``<h1>`` text (or the first ``<h1>``) and the
+    table captioned ``TARGET_CAPTION``. Tables passed on the way are cleared
+    so the whole page is never held in memory as a tree.
+    """
+    target = TARGET_CAPTION.lower()
+    header_text = None
+    titled = False
+    for _, element in etree.iterparse(
+        io.BytesIO(html), events=("end",), tag=("h1", "table"), html=True
+    ):
+        if element.tag == "h1":
+            if not titled and "page-title" in element.get("class", ""):
+                header_text = element_text(element)
+                titled = True
+            elif header_text is None:
+                header_text = element_text(element)
             continue
-        header_text = header_row.get_text(" ", strip=True).lower()
-        if "employment" in header_text and "chargeability" in header_text:
-            return table
+
+        caption = element.find("caption")
+        if caption is not None:
+            caption_text = " ".join(element_text(caption).lower().split())
+            if target in caption_text:
+                return header_text, element
+        element.clear()
+        while element.getprevious() is not None:
+            del element.getparent()[0]
+    return header_text, None
+
+
+def find_dos_employment_table(tree: etree._Element) -> etree._Element:
+    tables = DOS_EMPLOYMENT_TABLE_XPATH(tree)
+    if tables:
+        return tables[0]
     raise ValueError(
         "Could not locate the employment-based table on DOS bulletin page."
     )
 
 
-def find_target_row(table: Tag) -> Tag:
-    for row in table.find_all("tr"):
-        header_cell = row.find("th") or row.find("td")
-        if not header_cell:
-            continue
-        header_text = header_cell.get_text(" ", strip=True)
-        normalized = re.sub(r"\s+", " ", header_text).strip().lower()
-        normalized_alnum = re.sub(r"[^a-z0-9]+", " ", normalized).strip()
+def find_target_row(table: etree._Element) -> etree._Element:
+    for row in ROWS_XPATH(table):
+        # One normalisation pass: lower-case, then every run of characters
+        # that isn't ASCII alphanumeric (incl. Unicode dashes) to one space.
+        label = NON_ALNUM_RE.sub(" ", ROW_LABEL_XPATH(row).lower()).strip()
         if (
-            normalized.startswith(TARGET_ROW_LABEL.lower())
-            or normalized_alnum.startswith(TARGET_ROW_LABEL.lower())
-            or normalized.startswith("third")
-            or normalized_alnum.startswith("third")
-            or "eb 3" in normalized_alnum
-            or ("employment" in normalized and "third" in normalized)
+            label.startswith(TARGET_ROW_PREFIXES)
+            or "eb 3" in label
+            or ("employment" in label and "third" in label)
         ):
             return row
     raise ValueError(f"Could not find row labeled '{TARGET_ROW_LABEL}' in the table.")
 
 
-def get_chargeability_column_index(table: Tag) -> int:
-    header_section = table.find("thead")
-    header_row = None
-    if header_section:
-        header_row = header_section.find("tr")
-    if header_row is None:
-        header_row = table.find("tr")
-    if header_row is None:
+def get_chargeability_column_index(table: etree._Element) -> int:
+    header_rows = THEAD_ROW_XPATH(table) or FIRST_ROW_XPATH(table)
+    if not header_rows:
         raise ValueError("Unable to locate header row in employment-based table.")
 
-    header_cells = header_row.find_all(["th", "td"])
+    header_cells = CELLS_XPATH(header_rows[0])
     if len(header_cells) <= 1:
         raise ValueError(
             "Employment-based table header does not contain expected columns."
         )
 
     for data_index, cell in enumerate(header_cells[1:]):
-        text = cell.get_text(" ", strip=True).lower()
+        text = element_text(cell).lower()
         if "all chargeability" in text:
             return data_index
 
@@ -233,11 +429,11 @@ def get_chargeability_column_index(table: Tag) -> int:
     )
 
 
-def parse_final_action_date(row: Tag, column_index: int) -> str:
-    cells = row.find_all(["td", "th"])
+def parse_final_action_date(row: etree._Element, column_index: int) -> str:
+    cells = CELLS_XPATH(row)
     if len(cells) <= column_index + 1:
         raise ValueError("Target column index exceeds available cells in the row.")
-    return cells[column_index + 1].get_text(strip=True)
+    return "".join(piece.strip() for piece in cells[column_index + 1].itertext())
 
 
 def compute_backlog_months(
@@ -249,9 +445,16 @@ def compute_backlog_months(
     if value in {"C", "CURRENT"}:
         return 0.0
 
+    # Hand-parse DDMMMYY (e.g. 15JAN23) rather than run strptime per record.
+    match = FINAL_ACTION_DATE_RE.fullmatch(value)
     try:
-        final_date = datetime.strptime(value, "%d%b%y")
-    except ValueError as exc:  # pragma: no cover - defensive
+        if match is None:
+            raise ValueError(value)
+        day, month_abbreviation, short_year = match.groups()
+        year = int(short_year)
+        year += 1900 if year >= 69 else 2000  # same pivot as %y
+        final_date = datetime(year, MONTH_ABBREVIATIONS[month_abbreviation], int(day))
+    except (KeyError, ValueError) as exc:  # pragma: no cover - defensive
         raise ValueError(
             f"Could not parse final action date '{final_action_text}'."
         ) from exc
@@ -260,28 +463,38 @@ def compute_backlog_months(
     if final_date > bulletin_date:
         return 0.0
 
-    delta = relativedelta(bulletin_date, final_date)
-    backlog = delta.years * 12 + delta.months + delta.days / 30.0
+    # Whole months plus leftover days / 30, matching relativedelta's split
+    # without building one per record. bulletin_date is always the 1st, so a
+    # later final-action day borrows a month and the leftover days run to the
+    # end of the month before the bulletin.
+    months = (bulletin_date.year - final_date.year) * 12 + (
+        bulletin_date.month - final_date.month
+    )
+    days = 0
+    if final_date.day > 1:
+        months -= 1
+        previous_month_length = (bulletin_date - timedelta(days=1)).day
+        days = previous_month_length - min(final_date.day, previous_month_length) + 1
+    backlog = months + days / 30.0
     return round(max(backlog, 0.0), 2)
 
 
-def extract_record(page_id: int) -> BulletinRecord:
-    html, url = fetch_page_html(page_id)
-    soup = BeautifulSoup(html, "html.parser")
-
-    bulletin_month = parse_bulletin_month(soup)
-    table = None
-    for caption in soup.find_all("caption"):
-        if TARGET_CAPTION.lower() in caption.get_text(strip=True).lower():
-            table = caption.find_parent("table")
-            break
+async def extract_record(client: httpx.AsyncClient, page_id: int) -> BulletinRecord:
+    html, url = await fetch_page_html(client, page_id)
+    header_text = table = None
+    # No caption means the DOS fallback; only the month is needed then.
+    if TARGET_CAPTION_RE.search(html):
+        header_text, table = scan_uscis_page(html)
+    bulletin_month = parse_bulletin_month(html, header_text)
     data_source_url = url
     if table is not None:
         column_index = get_chargeability_column_index(table)
         target_row = find_target_row(table)
         raw_value = parse_final_action_date(target_row, column_index)
     else:
-        raw_value, data_source_url = fetch_dos_final_action(bulletin_month)
+        raw_value, data_source_url = await fetch_dos_final_action(
+            client, bulletin_month
+        )
 
     backlog = compute_backlog_months(bulletin_month, raw_value)
 
@@ -293,65 +506,109 @@ def extract_record(page_id: int) -> BulletinRecord:
     )
 
 
-def collect_records() -> list[BulletinRecord]:
+async def extract_single_record(page_id: int) -> BulletinRecord:
+    """Run the per-page extraction for one USCIS page id, for debugging."""
+    async with make_client() as client:
+        return await extract_record(client, page_id)
+
+
+async def collect_records() -> list[BulletinRecord]:
     records_by_month: dict[datetime, BulletinRecord] = {}
-    try:
-        page_id = discover_latest_start_page_id()
-    except Exception as exc:  # pragma: no cover - network resilience
-        LOGGER.warning(
-            "Falling back to default start page id %s: %s",
-            DEFAULT_START_PAGE_ID,
-            exc,
-        )
-        page_id = DEFAULT_START_PAGE_ID
-    pages_checked = 0
-    consecutive_missing = 0
-    active_futures: dict = {}
+    # Misses are tracked by page id rather than completion order so a run of
+    # missing ids is recognised as soon as it exists, however tasks finish.
+    missing_ids: set[int] = set()
+    active_tasks: dict[asyncio.Task[BulletinRecord], int] = {}
+    cancelled_tasks: list[asyncio.Task[BulletinRecord]] = []
     stopping = False
 
-    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-        while (page_id > 0 or active_futures) and pages_checked < MAX_PAGES_TO_CHECK:
+    async with make_client() as client:
+        # While discovery runs, speculatively fetch the pages just below the
+        # default start id; they are almost always part of the crawl anyway.
+        discovery = asyncio.create_task(discover_latest_start_page_id(client))
+        speculative = {
+            asyncio.create_task(extract_record(client, pid)): pid
+            for pid in range(
+                DEFAULT_START_PAGE_ID,
+                max(DEFAULT_START_PAGE_ID - (MAX_CONCURRENT_REQUESTS - 1), 0),
+                -1,
+            )
+        }
+        try:
+            page_id = await discovery
+        except Exception as exc:  # pragma: no cover - network resilience
+            LOGGER.warning(
+                "Falling back to default start page id %s: %s",
+                DEFAULT_START_PAGE_ID,
+                exc,
+            )
+            page_id = DEFAULT_START_PAGE_ID
+
+        for task, pid in speculative.items():
+            if pid > page_id:
+                task.cancel()
+                cancelled_tasks.append(task)
+            else:
+                active_tasks[task] = pid
+        prefetched_ids = set(active_tasks.values())
+        pages_checked = len(prefetched_ids)
+
+        while (page_id > 0 or active_tasks) and pages_checked < MAX_PAGES_TO_CHECK:
             while (
                 not stopping
                 and page_id > 0
                 and pages_checked < MAX_PAGES_TO_CHECK
-                and len(active_futures) < MAX_WORKERS
+                and len(active_tasks) < MAX_CONCURRENT_REQUESTS
             ):
-                future = executor.submit(extract_record, page_id)
-                active_futures[future] = page_id
+                if page_id not in prefetched_ids:
+                    task = asyncio.create_task(extract_record(client, page_id))
+                    active_tasks[task] = page_id
+                    pages_checked += 1
                 page_id -= 1
-                pages_checked += 1
 
-            if not active_futures:
+            if not active_tasks:
                 break
 
-            done, _ = wait(active_futures.keys(), return_when=FIRST_COMPLETED)
-            for future in done:
-                pid = active_futures.pop(future)
+            done, _ = await asyncio.wait(
+                active_tasks.keys(), return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                pid = active_tasks.pop(task)
                 try:
-                    record = future.result()
+                    record = task.result()
                 except FileNotFoundError:
-                    consecutive_missing += 1
+                    # Only ids at or below the discovered start reach here, so
+                    # the miss is real; speculative ids above it were dropped.
+                    remember_missing(BASE_URL.format(pid))
+                    missing_ids.add(pid)
+                    run_low = run_high = pid
+                    while run_low - 1 in missing_ids:
+                        run_low -= 1
+                    while run_high + 1 in missing_ids:
+                        run_high += 1
+                    run_length = run_high - run_low + 1
                     LOGGER.info(
                         "USCIS page %s missing (%s consecutive).",
                         pid,
-                        consecutive_missing,
+                        run_length,
                     )
-                    if consecutive_missing >= CONSECUTIVE_NOT_FOUND_LIMIT:
+                    if not stopping and run_length >= CONSECUTIVE_NOT_FOUND_LIMIT:
                         LOGGER.info(
                             "Stopping after %s consecutive missing pages.",
-                            consecutive_missing,
+                            run_length,
                         )
                         stopping = True
                         page_id = 0
+                        # Pages below the gap are past the end of the archive.
+                        for pending, pending_id in list(active_tasks.items()):
+                            if pending_id < run_low and not pending.done():
+                                pending.cancel()
+                                cancelled_tasks.append(pending)
+                                del active_tasks[pending]
                 except ValueError as exc:
                     LOGGER.warning("Skipping page %s: %s", pid, exc)
-                    consecutive_missing = 0
                 except Exception as exc:  # pragma: no cover - diagnostic
                     LOGGER.error("Failed to process page %s: %s", pid, exc)
-                    consecutive_missing = 0
                 else:
-                    consecutive_missing = 0
                     if record.bulletin_month not in records_by_month:
                         records_by_month[record.bulletin_month] = record
                         LOGGER.info(
@@ -361,6 +618,12 @@ def collect_records() -> list[BulletinRecord]:
                             record.month_label,
                         )
 
+        # Let cancelled and leftover tasks unwind before the client closes.
+        leftovers = cancelled_tasks + list(active_tasks)
+        for task in active_tasks:
+            task.cancel()
+        await asyncio.gather(*leftovers, return_exceptions=True)
+
     if not records_by_month:
         LOGGER.warning("No records collected after checking %s pages.", pages_checked)
 
@@ -368,29 +631,155 @@ def collect_records() -> list[BulletinRecord]:
 
 
 def write_csv(records: list[BulletinRecord], destination: Path) -> None:
-    with destination.open("w", newline="", encoding="utf-8") as csvfile:
+    with destination.open(
+        "w", newline="", encoding="utf-8", buffering=1 << 20
+    ) as csvfile:
         writer = csv.writer(csvfile)
         writer.writerow(["month", "final_action", "backlog_months", "source_url"])
-        for record in records:
-            backlog_value = (
-                ""
-                if record.backlog_months is None or math.isnan(record.backlog_months)
-                else f"{record.backlog_months:.2f}"
-            )
-            writer.writerow(
-                [
-                    record.month_label,
-                    record.raw_date,
-                    backlog_value,
-                    record.source_url,
-                ]
+        writer.writerows(
+            (
+                record.month_label,
+                record.raw_date,
+                (
+                    ""
+                    if record.backlog_months is None
+                    or math.isnan(record.backlog_months)
+                    else f"{record.backlog_months:.2f}"
+                ),
+                record.source_url,
             )
+            for record in records
+        )
+
+
+def nice_tick_step(max_value: float, target_ticks: int = 6) -> float:
+    """Pick a 1/2/5 x 10^n step that splits ``0..max_value`` into ~target_ticks."""
+    raw_step = max(max_value, 1.0) / target_ticks
+    magnitude = 10 ** math.floor(math.log10(raw_step))
+    for multiple in (1, 2, 5):
+        if raw_step <= multiple * magnitude:
+            return multiple * magnitude
+    return 10 * magnitude
 
 
 def generate_plot(records: list[BulletinRecord], destination: Path) -> None:
+    """Write the backlog line chart as a standalone SVG file."""
+    if not records:
+        raise ValueError("No data available to plot.")
+
+    width, height = 1400, 600
+    left, right, top, bottom = 80, 30, 60, 70
+    plot_width = width - left - right
+    plot_height = height - top - bottom
+
+    x_days = [record.bulletin_month.replace(day=1).toordinal() for record in records]
+    y_values = [
+        math.nan if record.backlog_months is None else record.backlog_months
+        for record in records
+    ]
+    x_min, x_max = min(x_days), max(x_days)
+    x_span = (x_max - x_min) or 1
+    y_peak = max((value for value in y_values if not math.isnan(value)), default=0.0)
+    y_step = nice_tick_step(y_peak)
+    y_tick_count = max(math.ceil(y_peak / y_step), 1)
+    y_max = y_step * y_tick_count
+
+    def to_x(day: int) -> float:
+        return left + (day - x_min) / x_span * plot_width
+
+    def to_y(value: float) -> float:
+        return top + plot_height - value / y_max * plot_height
+
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+        f'viewBox="0 0 {width} {height}" font-family="sans-serif" font-size="13">',
+        f'<rect width="{width}" height="{height}" fill="white"/>',
+        f'<text x="{width / 2}" y="32" text-anchor="middle" font-size="18">'
+        f"{PLOT_TITLE}</text>",
+    ]
+
+    for index in range(y_tick_count + 1):
+        value = index * y_step
+        y = to_y(value)
+        parts.append(
+            f'<line x1="{left}" y1="{y:.1f}" x2="{width - right}" y2="{y:.1f}" '
+            'stroke="black" stroke-opacity="0.1"/>'
+        )
+        parts.append(
+            f'<text x="{left - 8}" y="{y:.1f}" text-anchor="end" '
+            f'dominant-baseline="middle">{value:g}</text>'
+        )
+
+    first_month = datetime.fromordinal(x_min)
+    last_month = datetime.fromordinal(x_max)
+    x_ticks = [
+        (datetime(year, 1, 1).toordinal(), str(year))
+        for year in range(
+            first_month.year + (first_month.month > 1), last_month.year + 1
+        )
+    ] or [(x_min, first_month.strftime("%b %Y"))]
+    for day, label in x_ticks:
+        x = to_x(day)
+        parts.append(
+            f'<line x1="{x:.1f}" y1="{top}" x2="{x:.1f}" y2="{top + plot_height}" '
+            'stroke="black" stroke-opacity="0.1"/>'
+        )
+        parts.append(
+            f'<text x="{x:.1f}" y="{top + plot_height + 20}" '
+            f'text-anchor="middle">{label}</text>'
+        )
+
+    parts.append(
+        f'<path d="M{left},{top} V{top + plot_height} H{width - right}" '
+        'fill="none" stroke="black"/>'
+    )
+    parts.append(
+        f'<text x="{left + plot_width / 2}" y="{height - 20}" '
+        f'text-anchor="middle">{PLOT_X_LABEL}</text>'
+    )
+    parts.append(
+        f'<text x="20" y="{top + plot_height / 2}" text-anchor="middle" '
+        f'transform="rotate(-90 20 {top + plot_height / 2})">{PLOT_Y_LABEL}</text>'
+    )
+
+    # Like matplotlib, break the line wherever the backlog is unknown (NaN).
+    segments: list[list[tuple[float, float]]] = [[]]
+    for day, value in zip(x_days, y_values):
+        if math.isnan(value):
+            if segments[-1]:
+                segments.append([])
+            continue
+        segments[-1].append((to_x(day), to_y(value)))
+    for segment in segments:
+        if not segment:
+            continue
+        points = " ".join(f"{x:.1f},{y:.1f}" for x, y in segment)
+        parts.append(
+            f'<polyline points="{points}" fill="none" '
+            f'stroke="{PLOT_COLOR}" stroke-width="2"/>'
+        )
+        parts.extend(
+            f'<circle cx="{x:.1f}" cy="{y:.1f}" r="3.5" fill="{PLOT_COLOR}"/>'
+            for x, y in segment
+        )
+
+    parts.append("</svg>")
+    destination.write_text("\n".join(parts) + "\n", encoding="utf-8")
+
+
+def generate_png_plot(records: list[BulletinRecord], destination: Path) -> None:
+    """Render the chart with matplotlib, which is only needed for ``--png``."""
     if not records:
         raise ValueError("No data available to plot.")
 
+    try:
+        import matplotlib.dates as mdates
+        import matplotlib.pyplot as plt
+    except ImportError as exc:
+        raise SystemExit(
+            "--png needs matplotlib; install it with `pip install matplotlib`."
+        ) from exc
+
     x_dates = [record.bulletin_month.replace(day=1) for record in records]
     x_values = mdates.date2num(x_dates)
     y_values = [
@@ -406,7 +795,7 @@ def generate_plot(records: list[BulletinRecord], destination: Path) -> None:
         linestyle="-",
         marker="o",
         linewidth=2,
-        color="#2a6f97",
+        color=PLOT_COLOR,
     )
     ax.xaxis_date()
     locator = mdates.AutoDateLocator(minticks=6, maxticks=14)
@@ -414,36 +803,68 @@ def generate_plot(records: list[BulletinRecord], destination: Path) -> None:
     ax.xaxis.set_major_locator(locator)
     ax.xaxis.set_major_formatter(formatter)
 
-    plt.title("EB-3 All Chargeability Backlog (Final Action Dates)")
-    plt.xlabel("Visa Bulletin Month")
-    plt.ylabel("Backlog (months)")
+    plt.title(PLOT_TITLE)
+    plt.xlabel(PLOT_X_LABEL)
+    plt.ylabel(PLOT_Y_LABEL)
     plt.grid(True, alpha=0.3)
     plt.tight_layout()
     plt.savefig(destination, dpi=200)
     plt.close()
 
 
-def main() -> None:
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--png",
+        action="store_true",
+        help="also render a PNG chart with matplotlib (installed separately)",
+    )
+    parser.add_argument(
+        "--debug-page",
+        type=int,
+        metavar="ID",
+        help="extract a single USCIS page id and log the result instead of crawling",
+    )
+    args = parser.parse_args(argv)
+
     logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 
-    records = collect_records()
+    if args.debug_page is not None:
+        try:
+            record = asyncio.run(extract_single_record(args.debug_page))
+        except (FileNotFoundError, ValueError) as exc:
+            raise SystemExit(f"Page {args.debug_page}: {exc}") from exc
+        LOGGER.info(
+            "Page %s (%s): final action %s, backlog %s months, source %s",
+            args.debug_page,
+            record.month_label,
+            record.raw_date,
+            record.backlog_label,
+            record.source_url,
+        )
+        return
+
+    records = asyncio.run(collect_records())
 
     if not records:
         raise SystemExit("No records were collected. Aborting.")
 
-    records.sort(key=lambda item: item.bulletin_month)
-
     output_dir = Path("artifacts")
     output_dir.mkdir(exist_ok=True)
 
     csv_path = output_dir / "eb3_backlog_months.csv"
-    png_path = output_dir / "eb3_backlog_months.png"
+    svg_path = output_dir / "eb3_backlog_months.svg"
 
     write_csv(records, csv_path)
-    generate_plot(records, png_path)
+    generate_plot(records, svg_path)
 
     LOGGER.info("Saved CSV data to %s", csv_path.resolve())
-    LOGGER.info("Saved backlog chart to %s", png_path.resolve())
+    LOGGER.info("Saved backlog chart to %s", svg_path.resolve())
+
+    if args.png:
+        png_path = output_dir / "eb3_backlog_months.png"
+        generate_png_plot(records, png_path)
+        LOGGER.info("Saved PNG backlog chart to %s", png_path.resolve())
 
     latest = records[-1]
     LOGGER.info(